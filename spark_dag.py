@@ -20,6 +20,8 @@
 Example Airflow DAG to submit Apache Spark applications using
 `SparkSubmitOperator`, `SparkJDBCOperator` and `SparkSqlOperator`.
 """
+import os
+
 from airflow.models import DAG
 from airflow.providers.apache.spark.operators.spark_submit import SparkSubmitOperator
 from airflow.utils.dates import days_ago
@@ -28,6 +30,21 @@ args = {
     'owner': 'Airflow',
 }
 
+# Optional prebuilt, packed Python environment (e.g. from venv-pack) for the Python job.
+# When set, the packages in the archive are available on the executors without
+# installing them on each node.
+pyspark_env_archive = os.environ.get('PYSPARK_ENV_ARCHIVE')
+python_job_conf = {}
+if pyspark_env_archive:
+    python_job_conf = {
+        'spark.archives': pyspark_env_archive + '#environment',
+        'spark.pyspark.python': './environment/bin/python',
+    }
+    # In client mode the driver does not run inside the unpacked archive. Only override its
+    # interpreter when one is given, so spark-defaults can set it otherwise.
+    if 'PYSPARK_DRIVER_PYTHON' in os.environ:
+        python_job_conf['spark.pyspark.driver.python'] = os.environ['PYSPARK_DRIVER_PYTHON']
+
 with DAG(
     dag_id='example_spark_operator',
     default_args=args,
@@ -38,7 +55,8 @@ with DAG(
     # [START howto_operator_spark_submit]
     
     python_submit_job = SparkSubmitOperator(
-        application="/workspace/example-airflow-and-spark/spark-3.1.1-bin-hadoop2.7/examples/src/main/python/pi.py", task_id="python_job"
+        application="/workspace/example-airflow-and-spark/spark-3.1.1-bin-hadoop2.7/examples/src/main/python/pi.py",
+        conf=python_job_conf, task_id="python_job"
     )
     
     scala_submit_job = SparkSubmitOperator(